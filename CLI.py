@@ -1,10 +1,9 @@
 import argparse
-import uuid
 import json
 import os
-from datetime import datetime
-from model import Process
 
+# model, plotting and the runners are imported inside the subcommands that use them,
+# so short commands like "list" start without loading them
 FILE = "processes.json"
 
 def load_processes():
@@ -13,6 +12,18 @@ def load_processes():
     with open(FILE, "r") as f:
         return json.load(f)
 
+def algorithm_class(parser, name):
+    from model import ALGORITHMS
+
+    if name not in ALGORITHMS:
+        parser.error(f"unknown algorithm {name!r}, choose from {', '.join(ALGORITHMS)}")
+    return ALGORITHMS[name]
+
+def check_timing(parser, args):
+    # same limits as the GUI: a zero quantum never makes progress on the preemptive algorithms
+    if args.quantum < 1 or args.overheat < 1:
+        parser.error("--quantum and --overheat must be at least 1")
+
 def main():
     parser = argparse.ArgumentParser(description="Gerencia nomes")
     subparsers = parser.add_subparsers(dest="comando", required=True)
@@ -29,9 +40,47 @@ def main():
     # subcomand “list”
     parser_list = subparsers.add_parser("list", help="List all process")
 
+    # subcomand “render”
+    parser_render = subparsers.add_parser("render", help="run a simulation and save its Gantt chart without the GUI")
+    parser_render.add_argument("algorithm", help="scheduling algorithm (FIFO, SJF, Round Robin, EDF, CFS)")
+    parser_render.add_argument("output", help="output file (.png, .svg, .pdf or .html)")
+    parser_render.add_argument("--file", default=FILE, help="processes JSON file")
+    parser_render.add_argument("--quantum", default=2, type=int, help="quantum")
+    parser_render.add_argument("--overheat", default=1, type=int, help="overheat")
+    parser_render.add_argument("--disk-cost", default=0, type=int, help="disk cost")
+    parser_render.add_argument("--gray-after-deadline", action="store_true", help="gray out execution past the deadline")
+
+    # subcomand “live”
+    parser_live = subparsers.add_parser("live", help="run a live simulation fed with JSONL processes")
+    parser_live.add_argument("algorithm", help="scheduling algorithm (FIFO, SJF, Round Robin, EDF, CFS)")
+    parser_live.add_argument("--quantum", default=2, type=int, help="quantum")
+    parser_live.add_argument("--overheat", default=1, type=int, help="overheat")
+    parser_live.add_argument("--scale", default=1.0, type=float, help="real seconds per time unit (0 replays the feed as fast as possible once it is closed)")
+    parser_live.add_argument("--socket", default=None, help="listen on this unix socket instead of reading stdin")
+
+    # subcomand “replicate”
+    parser_rep = subparsers.add_parser("replicate", help="run seeded random workloads and report confidence intervals")
+    parser_rep.add_argument("algorithm", help="scheduling algorithm (FIFO, SJF, Round Robin, EDF, CFS)")
+    parser_rep.add_argument("--spec", default=None, help="workload distribution spec (JSON file)")
+    parser_rep.add_argument("--quantum", default=2, type=int, help="quantum")
+    parser_rep.add_argument("--overheat", default=1, type=int, help="overheat")
+    parser_rep.add_argument("--disk-cost", default=0, type=int, help="disk cost")
+    parser_rep.add_argument("--target", action="append", default=[], metavar="METRIC=WIDTH", help="stop once the CI of METRIC is at most WIDTH wide")
+    parser_rep.add_argument("--confidence", default=0.95, type=float, help="confidence level")
+    parser_rep.add_argument("--min", default=5, type=int, help="minimum number of replications")
+    parser_rep.add_argument("--max", default=200, type=int, help="maximum number of replications")
+    parser_rep.add_argument("--workers", default=None, type=int, help="worker processes (default: CPU count)")
+    parser_rep.add_argument("--seed", default=0, type=int, help="seed of the first replication")
+
+    # subcomand “serve”
+    parser_serve = subparsers.add_parser("serve", help="warm worker: answer JSONL simulation requests from stdin on stdout")
+    parser_serve.add_argument("--no-preload", action="store_true", help="don't import the plotting stack before the first request")
+
     args = parser.parse_args()
 
     if args.comando == "add":
+        from model import Process
+
         p = Process(args.name, args.arrival, args.duration, args.priority, args.deadline, args.pages)
 
         processes = load_processes()
@@ -49,5 +98,79 @@ def main():
         for i, proc in enumerate(processes, start=1):
             print(f"{i}. id={proc.get('id')} arrival={proc.get('arrival')} remaining={proc.get('remaining_time')} priority={proc.get('priority')} pages={proc.get('num_pages')} state={proc.get('state')}")
 
+    elif args.comando == "render":
+        from model import load_processes as load_simulation
+        from gantt import save_gantt, save_gantt_html
+
+        check_timing(parser, args)
+        executor = algorithm_class(parser, args.algorithm)(args.quantum, args.overheat, args.disk_cost, load_simulation(args.file))
+        executor.execute()
+
+        if args.output.lower().endswith(".html"):
+            save_gantt_html(executor, args.output, gray_after_deadline=args.gray_after_deadline)
+        else:
+            save_gantt(executor, args.output, gray_after_deadline=args.gray_after_deadline)
+        print(f"Chart saved to {args.output}")
+
+    elif args.comando == "live":
+        import asyncio
+        from live import run_live
+
+        algorithm_class(parser, args.algorithm)
+        check_timing(parser, args)
+
+        try:
+            asyncio.run(run_live(args.algorithm, args.quantum, args.overheat, args.scale, args.socket))
+        except KeyboardInterrupt:
+            pass
+
+    elif args.comando == "replicate":
+        from replication import DEFAULT_SPEC, METRICS, replicate, validate_spec
+
+        check_timing(parser, args)
+        if args.workers is not None and args.workers < 1:
+            parser.error("--workers must be at least 1")
+
+        spec = DEFAULT_SPEC
+        if args.spec:
+            try:
+                with open(args.spec, "r", encoding="utf-8") as f:
+                    spec = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                parser.error(f"could not read spec {args.spec!r}: {e}")
+        try:
+            validate_spec(spec)
+        except ValueError as e:
+            parser.error(f"invalid spec: {e}")
+
+        if not 0 < args.confidence < 1:
+            parser.error("--confidence must be strictly between 0 and 1")
+        if args.min < 2:
+            parser.error("--min must be at least 2")
+        if args.max < args.min:
+            parser.error("--max must not be smaller than --min")
+
+        targets = {}
+        for t in args.target:
+            metric, _, width = t.partition("=")
+            if metric not in METRICS:
+                parser.error(f"unknown metric {metric!r}, choose from {', '.join(METRICS)}")
+            try:
+                targets[metric] = float(width)
+            except ValueError:
+                parser.error(f"invalid target {t!r}, expected METRIC=WIDTH")
+
+        summary = replicate(
+            algorithm_class(parser, args.algorithm), args.quantum, args.overheat, args.disk_cost, spec,
+            targets=targets, confidence=args.confidence, min_replications=args.min,
+            max_replications=args.max, workers=args.workers, base_seed=args.seed
+        )
+        print(json.dumps(summary, indent=4))
+
+    elif args.comando == "serve":
+        from worker import serve
+
+        serve(warm=not args.no_preload)
+
 if __name__ == "__main__":
     main()
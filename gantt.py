@@ -0,0 +1,332 @@
+import json
+
+import numpy as np
+
+MAX_ROW_LABELS = 60
+MAX_TIME_TICKS = 50
+
+def select_color(state_type: str) -> str:
+    if state_type == "executing":
+        return "green"
+    if state_type == "waiting":
+        return "blue"
+    if state_type == "overhead":
+        return "red"
+    return "gray"
+
+def gantt_segments(alg):
+    rows = []
+    starts = []
+    widths = []
+    types = []
+    deadlines = []
+
+    for y, p in enumerate(alg.finished_process):
+        current_time = p.arrival
+        dline = p.absolute_deadline if p.absolute_deadline is not None else np.nan
+        for state in p.time_line:
+            rows.append(y)
+            starts.append(current_time)
+            widths.append(state.duration)
+            types.append(state.type)
+            deadlines.append(dline)
+            current_time += state.duration
+
+    return {
+        "ids": [p.id for p in alg.finished_process],
+        "row": np.asarray(rows, dtype=np.int64),
+        "start": np.asarray(starts, dtype=float),
+        "width": np.asarray(widths, dtype=float),
+        "type": np.asarray(types, dtype=object),
+        "deadline": np.asarray(deadlines, dtype=float),
+    }
+
+def split_deadline_overrun(seg, gray_after_deadline):
+    start = seg["start"]
+    width = seg["width"]
+    row = seg["row"]
+    # one select_color call per distinct state type, then a vectorized lookup
+    kinds, kind_idx = np.unique(seg["type"].astype(str), return_inverse=True)
+    colors = np.array([select_color(k) for k in kinds], dtype=object)[kind_idx]
+
+    if not gray_after_deadline or start.size == 0:
+        return row, start, width, colors
+
+    dline = seg["deadline"]
+    over = ~np.isnan(dline) & (dline < start + width)
+    kept = np.where(over, np.clip(dline - start, 0, width), width)
+
+    gray = over & (kept < width)
+    row = np.concatenate([row, row[gray]])
+    new_start = np.concatenate([start, start[gray] + kept[gray]])
+    new_width = np.concatenate([kept, width[gray] - kept[gray]])
+    colors = np.concatenate([colors, np.full(gray.sum(), select_color("deadline"), dtype=object)])
+
+    visible = new_width > 0
+    return row[visible], new_start[visible], new_width[visible], colors[visible]
+
+def cull_labels(ax, xs, ys, labels, fontsize):
+    if len(labels) == 0:
+        return np.zeros(0, dtype=bool)
+
+    px = ax.figure.dpi / 72.0
+    # rotated text: horizontal extent is the font height, vertical is the string length
+    cell_w = fontsize * px * 1.2
+    cell_h = fontsize * px * 0.6 * max(len(s) for s in labels) + 2
+    pts = ax.transData.transform(np.column_stack([xs, ys]))
+    cx = np.floor(pts[:, 0] / cell_w).astype(np.int64)
+    cy = np.floor(pts[:, 1] / cell_h).astype(np.int64)
+
+    occupied = set()
+    keep = np.zeros(len(labels), dtype=bool)
+    for i in range(len(labels)):
+        cell = (cx[i], cy[i])
+        if any((cell[0] + dx, cell[1] + dy) in occupied for dx in (-1, 0, 1) for dy in (-1, 0, 1)):
+            continue
+        occupied.add(cell)
+        keep[i] = True
+    return keep
+
+def build_gantt(alg,gray_after_deadline: bool = False):
+    # matplotlib is only loaded for raster/vector charts; the HTML export doesn't need it
+    from matplotlib.collections import LineCollection, PolyCollection
+    from matplotlib.figure import Figure
+    from matplotlib.lines import Line2D
+
+    fig = Figure(figsize=(10, 5), dpi=100)
+    ax = fig.add_subplot(111)
+
+    seg = gantt_segments(alg)
+    ids = seg["ids"]
+    row, start, width, colors = split_deadline_overrun(seg, gray_after_deadline)
+
+    x0 = start
+    x1 = start + width
+    y0 = row.astype(float)
+    y1 = y0 + 0.8
+    verts = np.stack([
+        np.column_stack([x0, y0]),
+        np.column_stack([x0, y1]),
+        np.column_stack([x1, y1]),
+        np.column_stack([x1, y0]),
+    ], axis=1)
+    ax.add_collection(PolyCollection(
+        verts, facecolors=list(colors), edgecolors="black", alpha=0.9
+    ))
+
+    max_time = float((seg["start"] + seg["width"]).max()) if seg["start"].size else 0
+
+    dl_rows = np.array([y for y, p in enumerate(alg.finished_process) if p.absolute_deadline is not None], dtype=np.int64)
+    dl_x = np.array([alg.finished_process[y].absolute_deadline for y in dl_rows], dtype=float)
+    if dl_rows.size:
+        dl_segments = np.stack([
+            np.column_stack([dl_x, dl_rows - 0.1]),
+            np.column_stack([dl_x, dl_rows + 0.9]),
+        ], axis=1)
+        ax.add_collection(LineCollection(
+            dl_segments, colors="brown", linestyles="--", linewidths=0.8, alpha=0.6
+        ))
+
+    # keep tick counts bounded so long runs don't spend the draw in axis labels
+    y_step = max(1, -(-len(ids) // MAX_ROW_LABELS))
+    ticks = [y + 0.4 for y in range(0, len(ids), y_step)]
+    labels = [str(k) for k in ids[::y_step]]
+    ax.set_yticks(ticks)
+    ax.set_yticklabels(labels)
+
+    x_step = max(2, 2 * -(-int(max_time) // (2 * MAX_TIME_TICKS)))
+    ax.set_xlim(0, max_time + 1)
+    ax.set_xticks(range(0, int(max_time) + 1, x_step))
+    ax.set_ylim(-0.1, max(0, len(ids)) )
+    ax.set_xlabel("Tempo")
+    ax.set_title("Gráfico de Gantt")
+
+    ax.invert_yaxis()
+
+    fig.tight_layout()
+
+    if dl_rows.size:
+        names = [str(ids[y]) for y in dl_rows]
+        keep = cull_labels(ax, dl_x + 0.1, dl_rows + 0.4, names, 8)
+        for y, dline, name in zip(dl_rows[keep], dl_x[keep], np.asarray(names, dtype=object)[keep]):
+            ax.text(
+                dline + 0.1,
+                y + 0.4,
+                name,
+                color="black",
+                fontsize=8,
+                rotation=90,
+                va="center"
+            )
+
+    legend_elements = [
+    Line2D([0], [0], color="green", lw=6, label="Executando"),
+    Line2D([0], [0], color="blue", lw=6, label="Esperando"),
+    Line2D([0], [0], color="red", lw=6, label="Overhead"),
+    Line2D([0], [0], color="grey", lw=6, label="Estouro de deadline"),
+    Line2D([0], [0], color="brown", lw=2, linestyle="--", label="Deadline Absoluto"),
+]
+
+    ax.legend(handles=legend_elements, loc="upper right")
+
+    return fig
+
+def save_gantt(alg, path, gray_after_deadline: bool = False, fmt=None):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = build_gantt(alg, gray_after_deadline=gray_after_deadline)
+    FigureCanvasAgg(fig)
+    fig.savefig(path, format=fmt)
+
+def _compact(values):
+    if values.size and np.all(values == np.round(values)):
+        return values.astype(np.int64).tolist()
+    return values.tolist()
+
+def gantt_timeline_data(alg, gray_after_deadline: bool = False):
+    seg = gantt_segments(alg)
+    row, start, width, colors = split_deadline_overrun(seg, gray_after_deadline)
+
+    palette, color_idx = np.unique(colors.astype(str), return_inverse=True)
+    order = np.lexsort((start, row))
+    row = row[order]
+    start = start[order]
+
+    # columnar and delta-encoded per row: consecutive segments of a row mostly start where the previous one ended
+    delta = np.diff(start, prepend=0.0)
+    row_change = np.ones(row.size, dtype=bool)
+    row_change[1:] = row[1:] != row[:-1]
+    delta[row_change] = start[row_change]
+
+    dl_rows = [y for y, p in enumerate(alg.finished_process) if p.absolute_deadline is not None]
+    return {
+        "ids": [str(k) for k in seg["ids"]],
+        "palette": palette.tolist(),
+        "row": row.tolist(),
+        "start": _compact(delta),
+        "width": _compact(width[order]),
+        "color": color_idx[order].tolist(),
+        "deadline_row": dl_rows,
+        "deadline": [alg.finished_process[y].absolute_deadline for y in dl_rows],
+        "max_time": float((seg["start"] + seg["width"]).max()) if seg["start"].size else 0,
+    }
+
+def save_gantt_html(alg, path, gray_after_deadline: bool = False, title="Gráfico de Gantt"):
+    data = gantt_timeline_data(alg, gray_after_deadline)
+    payload = json.dumps(data, separators=(",", ":")).replace("</", "<\\/")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(HTML_TEMPLATE.replace("__TITLE__", title).replace("__DATA__", payload))
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="pt-br">
+<head>
+<meta charset="utf-8">
+<title>__TITLE__</title>
+<style>
+  body { margin: 0; font-family: sans-serif; }
+  header { padding: 6px 10px; font-size: 14px; }
+  header span { display: inline-block; width: 12px; height: 12px; margin: 0 4px 0 12px; vertical-align: middle; }
+  canvas { display: block; width: 100vw; height: calc(100vh - 32px); cursor: grab; }
+</style>
+</head>
+<body>
+<header>__TITLE__ &mdash; roda do mouse: zoom, arrastar: mover
+  <span style="background:green"></span>Executando
+  <span style="background:blue"></span>Esperando
+  <span style="background:red"></span>Overhead
+  <span style="background:gray"></span>Estouro de deadline
+  <span style="background:brown"></span>Deadline Absoluto
+</header>
+<canvas id="gantt"></canvas>
+<script>
+const D = __DATA__;
+const n = D.row.length;
+const start = new Float64Array(n);
+for (let i = 0, acc = 0; i < n; i++) {
+  acc = (i === 0 || D.row[i] !== D.row[i - 1]) ? D.start[i] : acc + D.start[i];
+  start[i] = acc;
+}
+const canvas = document.getElementById("gantt");
+const ctx = canvas.getContext("2d");
+const LEFT = 60, BOTTOM = 24;
+let view = { x0: 0, x1: D.max_time + 1, y0: 0, y1: Math.max(D.ids.length, 1) };
+
+function draw() {
+  const dpr = window.devicePixelRatio || 1;
+  const w = canvas.clientWidth, h = canvas.clientHeight;
+  canvas.width = w * dpr; canvas.height = h * dpr;
+  ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+  ctx.clearRect(0, 0, w, h);
+  const sx = (w - LEFT) / (view.x1 - view.x0), sy = (h - BOTTOM) / (view.y1 - view.y0);
+  const X = t => LEFT + (t - view.x0) * sx, Y = r => (r - view.y0) * sy;
+
+  ctx.save();
+  ctx.beginPath(); ctx.rect(LEFT, 0, w - LEFT, h - BOTTOM); ctx.clip();
+  const rowLo = Math.floor(view.y0), rowHi = Math.ceil(view.y1);
+  for (let c = 0; c < D.palette.length; c++) {
+    ctx.fillStyle = D.palette[c];
+    ctx.beginPath();
+    for (let i = 0; i < n; i++) {
+      if (D.color[i] !== c || D.row[i] < rowLo || D.row[i] > rowHi) continue;
+      const a = X(start[i]), b = X(start[i] + D.width[i]);
+      if (b < LEFT || a > w) continue;
+      ctx.rect(a, Y(D.row[i]), Math.max(b - a, 0.5), 0.8 * sy);
+    }
+    ctx.fill();
+  }
+  ctx.strokeStyle = "brown"; ctx.setLineDash([4, 3]); ctx.beginPath();
+  for (let i = 0; i < D.deadline.length; i++) {
+    const r = D.deadline_row[i];
+    if (r < rowLo || r > rowHi) continue;
+    const x = X(D.deadline[i]);
+    ctx.moveTo(x, Y(r - 0.1)); ctx.lineTo(x, Y(r + 0.9));
+  }
+  ctx.stroke(); ctx.setLineDash([]);
+  ctx.restore();
+
+  ctx.fillStyle = "black"; ctx.font = "11px sans-serif"; ctx.textBaseline = "middle";
+  const rowStep = Math.max(1, Math.ceil(14 / sy));
+  for (let r = Math.max(0, rowLo - rowLo % rowStep); r <= rowHi && r < D.ids.length; r += rowStep) {
+    ctx.fillText(D.ids[r], 4, Y(r + 0.4));
+  }
+  const span = view.x1 - view.x0;
+  let step = Math.pow(10, Math.floor(Math.log10(span / 10)));
+  if (span / step > 20) step *= 5; else if (span / step > 10) step *= 2;
+  ctx.textBaseline = "top";
+  for (let t = Math.ceil(view.x0 / step) * step; t <= view.x1; t += step) {
+    ctx.fillText(String(+t.toFixed(6)), X(t) - 4, h - BOTTOM + 6);
+  }
+}
+
+canvas.addEventListener("wheel", e => {
+  e.preventDefault();
+  const k = e.deltaY > 0 ? 1.2 : 1 / 1.2;
+  const rect = canvas.getBoundingClientRect();
+  const fx = Math.min(Math.max((e.clientX - rect.left - LEFT) / (rect.width - LEFT), 0), 1);
+  const fy = Math.min(Math.max((e.clientY - rect.top) / (rect.height - BOTTOM), 0), 1);
+  if (!e.shiftKey) {
+    const cx = view.x0 + fx * (view.x1 - view.x0);
+    view.x0 = cx - (cx - view.x0) * k; view.x1 = cx + (view.x1 - cx) * k;
+  } else {
+    const cy = view.y0 + fy * (view.y1 - view.y0);
+    view.y0 = cy - (cy - view.y0) * k; view.y1 = cy + (view.y1 - cy) * k;
+  }
+  draw();
+}, { passive: false });
+
+let drag = null;
+canvas.addEventListener("mousedown", e => { drag = { x: e.clientX, y: e.clientY, v: { ...view } }; });
+window.addEventListener("mouseup", () => { drag = null; });
+window.addEventListener("mousemove", e => {
+  if (!drag) return;
+  const dx = (e.clientX - drag.x) / (canvas.clientWidth - LEFT) * (drag.v.x1 - drag.v.x0);
+  const dy = (e.clientY - drag.y) / (canvas.clientHeight - BOTTOM) * (drag.v.y1 - drag.v.y0);
+  view = { x0: drag.v.x0 - dx, x1: drag.v.x1 - dx, y0: drag.v.y0 - dy, y1: drag.v.y1 - dy };
+  draw();
+});
+window.addEventListener("resize", draw);
+draw();
+</script>
+</body>
+</html>
+"""
@@ -0,0 +1,370 @@
+import asyncio
+import contextlib
+import io
+import json
+import os
+import sys
+
+from model import ALGORITHMS, TimeLine, process_from_dict
+
+# algorithms that only give up the CPU when the process finishes
+NON_PREEMPTIVE = ("FIFO", "SJF")
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def validate_process(raw):
+    if not isinstance(raw, dict):
+        raise ValueError("O processo deve ser um objeto JSON.")
+    for field in ("id", "total_time", "priority"):
+        if field not in raw:
+            raise ValueError(f"Campo obrigatório ausente: {field}")
+    # priority weights the CFS vruntime, so like total_time it must be a positive int
+    for field in ("total_time", "priority"):
+        if not _is_int(raw[field]) or raw[field] <= 0:
+            raise ValueError(f"{field} deve ser um inteiro positivo.")
+    for field in ("arrival", "deadline", "num_pages"):
+        value = raw.get(field)
+        if value is not None and not _is_int(value):
+            raise ValueError(f"{field} deve ser um inteiro.")
+
+class LiveScheduler:
+    def __init__(self, algorithm: str, quantum: int, overheat: int, time_scale: float = 1.0):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Algoritmo desconhecido: {algorithm}")
+        if quantum < 1 or overheat < 1:
+            raise ValueError("Quantum e Overheat devem ser no mínimo 1.")
+
+        self.algorithm = algorithm
+        self.quantum = quantum
+        self.overheat = overheat
+        self.time_scale = time_scale
+
+        self.process_list = []
+        self.upcoming_processes = []
+        self.ready_queue = []
+        self.finished_process = []
+        self.actual_time = 0
+        self.idle_cpu = 0
+        self.overload_count = 0
+
+        self._subscribers = []
+        self._closed = False
+        self._wakeup = asyncio.Event()
+        self._mark = None
+
+    def _loop_time(self):
+        return asyncio.get_running_loop().time()
+
+    def now(self) -> int:
+        # simulated clock: the last committed time plus the wall time elapsed since, in scaled units
+        if self.time_scale <= 0 or self._mark is None:
+            return self.actual_time
+        return self.actual_time + int((self._loop_time() - self._mark) / self.time_scale)
+
+    def _advance_to(self, time):
+        self.actual_time = time
+        self._mark = self._loop_time()
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue()
+        self._subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue):
+        if queue in self._subscribers:
+            self._subscribers.remove(queue)
+
+    def _publish(self, event, **fields):
+        message = {"event": event, "time": self.actual_time, **fields}
+        for queue in self._subscribers:
+            queue.put_nowait(message)
+
+    def submit(self, raw: dict):
+        if self._closed:
+            raise RuntimeError("Simulação encerrada, não aceita novos processos.")
+
+        validate_process(raw)
+        raw = dict(raw)
+        raw["arrival"] = max(raw.get("arrival") or 0, self.now())
+        process = process_from_dict(raw)
+        process.last_active_time = process.arrival
+        # the batch algorithms break ties by position in process_list, i.e. submission order
+        process.submit_order = len(self.process_list)
+        self.process_list.append(process)
+
+        self.upcoming_processes.append(process)
+        self.upcoming_processes.sort(key=lambda p: p.arrival)
+        self._publish("submit", time=self.now(), id=process.id, arrival=process.arrival)
+        self._wakeup.set()
+        return process
+
+    def close(self):
+        self._closed = True
+        self._wakeup.set()
+
+    def _admit_arrivals(self):
+        while self.upcoming_processes and self.upcoming_processes[0].arrival <= self.actual_time:
+            p = self.upcoming_processes.pop(0)
+            if self.algorithm == "CFS":
+                if self.ready_queue:
+                    p.vruntime = min(proc.vruntime for proc in self.ready_queue)
+                else:
+                    p.vruntime = self.actual_time
+            p.state = 'pronto'
+            self.ready_queue.append(p)
+            self._publish("arrival", id=p.id)
+
+    def _select(self):
+        if self.algorithm == "CFS":
+            # same stable in-place sort as CFS_Sim, so vruntime ties resolve in the batch order
+            self.ready_queue.sort(key=lambda p: p.vruntime)
+            return self.ready_queue.pop(0)
+
+        if self.algorithm == "SJF":
+            process = min(self.ready_queue, key=lambda p: (p.remaining_time, p.submit_order))
+        elif self.algorithm == "EDF":
+            process = min(self.ready_queue, key=lambda p: (p.absolute_deadline if p.absolute_deadline is not None else float('inf'), p.submit_order))
+        else:
+            process = self.ready_queue[0]
+        self.ready_queue.remove(process)
+        return process
+
+    async def _wait_idle(self):
+        if self.upcoming_processes and self.time_scale <= 0:
+            target = self.upcoming_processes[0].arrival
+        else:
+            self._wakeup.clear()
+            timeout = None
+            if self.upcoming_processes:
+                timeout = max(0, (self.upcoming_processes[0].arrival - self.now()) * self.time_scale)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+                timed_out = False
+            except asyncio.TimeoutError:
+                timed_out = True
+            if not self.upcoming_processes:
+                # woken by close() with nothing left: the run ends at the last event, not at wall-clock now
+                return
+            next_arrival = self.upcoming_processes[0].arrival
+            target = next_arrival if timed_out else min(self.now(), next_arrival)
+
+        if target > self.actual_time:
+            self.idle_cpu += target - self.actual_time
+            self._advance_to(target)
+
+    async def _sleep(self, duration):
+        await asyncio.sleep(duration * self.time_scale if self.time_scale > 0 else 0)
+
+    async def run(self):
+        # at scale 0 there is no wall clock to pace the feed, so hold the clock until the feed
+        # is closed; the given arrivals are then kept instead of depending on read speed
+        while self.time_scale <= 0 and not self._closed:
+            self._wakeup.clear()
+            await self._wakeup.wait()
+
+        self._advance_to(self.actual_time)
+
+        while True:
+            self._admit_arrivals()
+
+            if not self.ready_queue:
+                if self._closed and not self.upcoming_processes:
+                    break
+                await self._wait_idle()
+                continue
+
+            process = self._select()
+
+            wait_duration = self.actual_time - process.last_active_time
+            if wait_duration > 0:
+                process.time_line.append(TimeLine(wait_duration, "waiting"))
+
+            if self.algorithm in NON_PREEMPTIVE:
+                time_slice = process.remaining_time
+            else:
+                time_slice = min(process.remaining_time, self.quantum)
+
+            process.state = 'em execução'
+            self._publish("dispatch", id=process.id, slice=time_slice)
+            await self._sleep(time_slice)
+            self._advance_to(self.actual_time + time_slice)
+
+            process.remaining_time -= time_slice
+            if self.algorithm == "CFS":
+                process.vruntime += time_slice * process.priority
+            process.time_line.append(TimeLine(time_slice, "executing"))
+            process.last_active_time = self.actual_time
+
+            if process.remaining_time == 0:
+                process.state = 'finalizado'
+                process.finish_time = self.actual_time
+                process.turnaround_time = process.finish_time - process.arrival
+                process.wait_time = process.turnaround_time - process.total_time
+                self.finished_process.append(process)
+                self._publish(
+                    "completion",
+                    id=process.id,
+                    turnaround=process.turnaround_time,
+                    wait=process.wait_time,
+                    deadline_ok=process.absolute_deadline is None or process.finish_time <= process.absolute_deadline
+                )
+            else:
+                self.overload_count += 1
+                process.state = 'pronto'
+                self._publish("preemption", id=process.id, remaining=process.remaining_time)
+                if self.overheat > 0:
+                    await self._sleep(self.overheat)
+                    self._advance_to(self.actual_time + self.overheat)
+                    process.time_line.append(TimeLine(self.overheat, "overhead"))
+                    process.last_active_time = self.actual_time
+
+                # Round_Robin queues what arrived during the slice ahead of the preempted process;
+                # CFS_Sim re-inserts it first, so those arrivals see its vruntime
+                if self.algorithm == "Round Robin":
+                    self._admit_arrivals()
+                self.ready_queue.append(process)
+
+        self._publish("end", finished=len(self.finished_process), idle=self.idle_cpu)
+
+def _submit_line(scheduler, line: bytes):
+    try:
+        text = line.decode("utf-8").strip()
+        if not text:
+            return None
+        raw = json.loads(text)
+        if isinstance(raw, dict) and raw.get("command") == "close":
+            scheduler.close()
+        else:
+            scheduler.submit(raw)
+    except (ValueError, KeyError, TypeError, RuntimeError) as e:
+        print(f"Linha ignorada ({e}): {line!r}", file=sys.stderr)
+        return str(e)
+    return None
+
+async def feed_jsonl(scheduler, reader, close_on_eof: bool = True, on_error=None):
+    while True:
+        try:
+            line = await reader.readline()
+        except ValueError as e:
+            # line longer than the stream limit; it is dropped and reading goes on
+            error = str(e)
+        else:
+            if not line:
+                break
+            error = _submit_line(scheduler, line)
+        if error and on_error is not None:
+            on_error(error)
+    if close_on_eof:
+        scheduler.close()
+
+class ThreadedLineReader:
+    # regular files can't back a pipe transport, so they are read line by line in a worker thread
+    def __init__(self, stream):
+        self.stream = stream
+
+    async def readline(self) -> bytes:
+        return await asyncio.get_running_loop().run_in_executor(None, self.stream.readline)
+
+async def stdin_reader():
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    try:
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    except ValueError:
+        return ThreadedLineReader(sys.stdin.buffer)
+    return reader
+
+async def write_events(queue: asyncio.Queue, writer):
+    while True:
+        event = await queue.get()
+        writer(json.dumps(event) + "\n")
+        if event["event"] == "end":
+            break
+
+async def serve_socket(scheduler, path: str):
+    async def handle(reader, writer):
+        queue = scheduler.subscribe()
+
+        async def send():
+            while True:
+                event = await queue.get()
+                writer.write((json.dumps(event) + "\n").encode("utf-8"))
+                await writer.drain()
+                if event["event"] == "end":
+                    break
+
+        def report(error):
+            queue.put_nowait({"event": "error", "time": scheduler.now(), "error": error})
+
+        sender = asyncio.create_task(send())
+        try:
+            await feed_jsonl(scheduler, reader, close_on_eof=False, on_error=report)
+            await sender
+        except (ConnectionError, asyncio.CancelledError):
+            sender.cancel()
+        finally:
+            scheduler.unsubscribe(queue)
+            writer.close()
+
+    return await asyncio.start_unix_server(handle, path=path)
+
+async def run_live(algorithm, quantum, overheat, time_scale=1.0, socket_path=None, out=sys.stdout):
+    scheduler = LiveScheduler(algorithm, quantum, overheat, time_scale)
+
+    def emit(text):
+        out.write(text)
+        out.flush()
+
+    printer = asyncio.create_task(write_events(scheduler.subscribe(), emit))
+
+    if socket_path is None:
+        feeder = asyncio.create_task(feed_jsonl(scheduler, await stdin_reader()))
+        await scheduler.run()
+        feeder.cancel()
+    else:
+        # socket clients come and go; the run ends for everyone once any client sends {"command": "close"}
+        server = await serve_socket(scheduler, socket_path)
+        try:
+            async with server:
+                await scheduler.run()
+        finally:
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+
+    await printer
+    return scheduler
+
+async def _replay(algorithm, processes, quantum, overheat):
+    scheduler = LiveScheduler(algorithm, quantum, overheat, time_scale=0)
+    for p in processes:
+        scheduler.submit({
+            "id": p.id,
+            "arrival": p.arrival,
+            "total_time": p.total_time,
+            "priority": p.priority,
+            "deadline": p.deadline_duration,
+            "num_pages": p.num_pages,
+        })
+    scheduler.close()
+    await scheduler.run()
+    return scheduler
+
+def check_against_batch(algorithm, processes, quantum, overheat):
+    # development aid, not wired to the CLI: runs the same workload through the batch
+    # algorithm and the live scheduler at scale 0 and returns the differences
+    batch = ALGORITHMS[algorithm](quantum, overheat, 0, processes)
+    with contextlib.redirect_stdout(io.StringIO()):
+        batch.execute()
+    live = asyncio.run(_replay(algorithm, processes, quantum, overheat))
+
+    mismatches = []
+    for field in ("actual_time", "idle_cpu", "overload_count"):
+        if getattr(batch, field) != getattr(live, field):
+            mismatches.append(f"{field}: batch={getattr(batch, field)} live={getattr(live, field)}")
+
+    live_finish = {p.id: p.finish_time for p in live.finished_process}
+    for p in batch.finished_process:
+        if live_finish.get(p.id) != p.finish_time:
+            mismatches.append(f"{p.id} finish_time: batch={p.finish_time} live={live_finish.get(p.id)}")
+    return mismatches
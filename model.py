@@ -1,4 +1,5 @@
 import copy
+import json
 from abc import ABC, abstractmethod
 from typing import List
 
@@ -331,4 +332,28 @@ class CFS_Sim(Algorithms):
 
                 ready_rbtree.append(process)
 
-        print(f"Simulação CFS concluída. Tempo total: {self.actual_time}")
\ No newline at end of file
+        print(f"Simulação CFS concluída. Tempo total: {self.actual_time}")
+
+ALGORITHMS = {
+    "FIFO": Fifo,
+    "SJF": Sjf,
+    "Round Robin": Round_Robin,
+    "EDF": EDF,
+    "CFS": CFS_Sim,
+}
+
+def process_from_dict(p):
+    return Process(
+        p["id"],
+        p["arrival"],
+        p["total_time"],
+        p["priority"],
+        p.get("deadline", None),
+        p.get("num_pages", 1)
+    )
+
+def load_processes(path):
+    with open(path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+
+    return [process_from_dict(p) for p in raw]
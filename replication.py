@@ -0,0 +1,239 @@
+import contextlib
+import io
+import math
+import os
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import lru_cache
+from statistics import NormalDist, fmean, stdev
+
+from model import Process
+
+METRICS = ("mean_turnaround", "mean_wait", "deadline_miss_rate", "throughput", "idle_percent")
+
+# example spec; every field except "processes" is a distribution
+DEFAULT_SPEC = {
+    "processes": 20,
+    "interarrival": {"dist": "exponential", "mean": 3},
+    "total_time": {"dist": "uniform", "low": 1, "high": 10},
+    "priority": {"dist": "uniform", "low": 1, "high": 5},
+    "deadline": {"dist": "uniform", "low": 10, "high": 40, "probability": 0.5},
+    "num_pages": {"dist": "constant", "value": 1},
+}
+
+def sample(rng: random.Random, dist: dict, minimum: int = 0) -> int:
+    kind = dist.get("dist", "constant")
+    if kind == "constant":
+        value = dist["value"]
+    elif kind == "uniform":
+        value = rng.randint(dist["low"], dist["high"])
+    elif kind == "exponential":
+        value = round(rng.expovariate(1.0 / dist["mean"]))
+    elif kind == "normal":
+        value = round(rng.gauss(dist["mean"], dist["std"]))
+    else:
+        raise ValueError(f"Distribuição desconhecida: {kind}")
+    return max(minimum, int(value))
+
+DIST_PARAMS = {
+    "constant": ("value",),
+    "uniform": ("low", "high"),
+    "exponential": ("mean",),
+    "normal": ("mean", "std"),
+}
+
+def validate_spec(spec: dict):
+    if not isinstance(spec, dict):
+        raise ValueError("A especificação deve ser um objeto JSON.")
+    n = spec.get("processes")
+    if not isinstance(n, int) or isinstance(n, bool) or n < 1:
+        raise ValueError("'processes' deve ser um inteiro positivo.")
+
+    for field in ("interarrival", "total_time", "priority", "deadline", "num_pages"):
+        dist = spec.get(field)
+        if dist is None:
+            continue
+        if not isinstance(dist, dict):
+            raise ValueError(f"'{field}' deve ser um objeto de distribuição.")
+        kind = dist.get("dist", "constant")
+        if kind not in DIST_PARAMS:
+            raise ValueError(f"Distribuição desconhecida em '{field}': {kind}")
+        for param in DIST_PARAMS[kind]:
+            value = dist.get(param)
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                raise ValueError(f"'{field}' ({kind}) precisa do parâmetro numérico '{param}'.")
+        if kind == "uniform" and (dist["low"] > dist["high"] or dist["low"] != int(dist["low"]) or dist["high"] != int(dist["high"])):
+            raise ValueError(f"'{field}': low e high devem ser inteiros com low <= high.")
+        if kind == "exponential" and dist["mean"] <= 0:
+            raise ValueError(f"'{field}': mean deve ser positivo.")
+        if kind == "normal" and dist["std"] < 0:
+            raise ValueError(f"'{field}': std não pode ser negativo.")
+        probability = dist.get("probability", 1.0)
+        if not isinstance(probability, (int, float)) or isinstance(probability, bool) or not 0 <= probability <= 1:
+            raise ValueError(f"'{field}': probability deve estar entre 0 e 1.")
+
+def generate_workload(spec: dict, seed: int):
+    rng = random.Random(seed)
+    processes = []
+    arrival = 0
+    for i in range(spec["processes"]):
+        if i > 0:
+            arrival += sample(rng, spec.get("interarrival", {"value": 0}))
+
+        deadline = None
+        deadline_dist = spec.get("deadline")
+        if deadline_dist is not None and rng.random() < deadline_dist.get("probability", 1.0):
+            deadline = sample(rng, deadline_dist, minimum=1)
+
+        processes.append(Process(
+            f"P{i}",
+            arrival,
+            sample(rng, spec.get("total_time", {"value": 1}), minimum=1),
+            sample(rng, spec.get("priority", {"value": 1}), minimum=1),
+            deadline,
+            sample(rng, spec.get("num_pages", {"value": 1}), minimum=1)
+        ))
+    return processes
+
+def run_metrics(executor) -> dict:
+    finished = executor.finished_process
+    n = len(finished)
+    if n == 0:
+        return dict.fromkeys(METRICS, 0.0)
+
+    with_deadline = [p for p in finished if p.absolute_deadline is not None]
+    missed = sum(1 for p in with_deadline if p.finish_time > p.absolute_deadline)
+    total_time = max(executor.actual_time, max(p.finish_time for p in finished))
+
+    return {
+        "mean_turnaround": fmean(p.finish_time - p.arrival for p in finished),
+        "mean_wait": fmean(p.finish_time - p.arrival - p.total_time for p in finished),
+        "deadline_miss_rate": missed / len(with_deadline) if with_deadline else 0.0,
+        "throughput": n / total_time if total_time > 0 else 0.0,
+        "idle_percent": executor.idle_cpu / total_time * 100 if total_time > 0 else 0.0,
+    }
+
+def run_replication(alg_cls, quantum, overheat, disk_cost, spec, seed) -> dict:
+    executor = alg_cls(quantum, overheat, disk_cost, generate_workload(spec, seed))
+    # the algorithms print a line per run; keep replications quiet
+    with contextlib.redirect_stdout(io.StringIO()):
+        executor.execute()
+    return run_metrics(executor)
+
+def _t_central(t: float, df: int) -> float:
+    # P(|T| < t) for Student's t with integer df, closed form
+    theta = math.atan(t / math.sqrt(df))
+    c2 = math.cos(theta) ** 2
+    if df % 2 == 1:
+        term, total = 1.0, 1.0 if df > 1 else 0.0
+        for k in range(2, df - 1, 2):
+            term *= c2 * k / (k + 1)
+            total += term
+        return 2 / math.pi * (theta + math.sin(theta) * math.cos(theta) * total)
+    term, total = 1.0, 1.0
+    for k in range(1, df - 2, 2):
+        term *= c2 * k / (k + 1)
+        total += term
+    return math.sin(theta) * total
+
+@lru_cache(maxsize=None)
+def t_quantile(p: float, df: int) -> float:
+    if df <= 30:
+        # exact: bisection on the closed-form CDF
+        target = 2 * p - 1
+        lo, hi = 0.0, 1.0
+        while _t_central(hi, df) < target:
+            hi *= 2
+        for _ in range(100):
+            mid = (lo + hi) / 2
+            if _t_central(mid, df) < target:
+                lo = mid
+            else:
+                hi = mid
+        return (lo + hi) / 2
+
+    # Cornish-Fisher expansion of Student's t around the normal quantile, accurate for large df
+    z = NormalDist().inv_cdf(p)
+    return (z
+            + (z**3 + z) / (4 * df)
+            + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * df**2)
+            + (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * df**3))
+
+def confidence_interval(values, confidence: float = 0.95) -> dict:
+    n = len(values)
+    mean = fmean(values)
+    if n < 2:
+        return {"mean": mean, "std": 0.0, "half_width": math.inf, "low": -math.inf, "high": math.inf}
+
+    std = stdev(values)
+    half = t_quantile(0.5 + confidence / 2, n - 1) * std / math.sqrt(n)
+    return {"mean": mean, "std": std, "half_width": half, "low": mean - half, "high": mean + half}
+
+def summarize(results, confidence: float = 0.95) -> dict:
+    return {m: confidence_interval([r[m] for r in results], confidence) for m in METRICS}
+
+def targets_met(summary: dict, targets: dict) -> bool:
+    return all(2 * summary[m]["half_width"] <= width for m, width in targets.items())
+
+def replicate(alg_cls, quantum, overheat, disk_cost, spec, targets=None, confidence: float = 0.95,
+              min_replications: int = 5, max_replications: int = 200, workers=None, base_seed: int = 0):
+    # targets maps a metric name to the maximum full CI width, e.g. {"mean_turnaround": 2.0}
+    targets = targets or {}
+    for m in targets:
+        if m not in METRICS:
+            raise ValueError(f"Métrica desconhecida: {m}")
+    if quantum < 1 or overheat < 1:
+        raise ValueError("Quantum e Overheat devem ser no mínimo 1.")
+    if workers is not None and workers < 1:
+        raise ValueError("workers deve ser no mínimo 1.")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence deve estar entre 0 e 1 (exclusivo).")
+    if min_replications < 2 or max_replications < min_replications:
+        raise ValueError("É preciso 2 <= min_replications <= max_replications.")
+    # fail here, not as a traceback inside a pool worker
+    validate_spec(spec)
+
+    results = []
+    done = {}
+    next_seed = base_seed
+    last_seed = base_seed + max_replications
+    stopped_early = False
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = {}
+        slots = workers or os.cpu_count() or 1
+
+        while True:
+            while next_seed < last_seed and len(in_flight) < slots:
+                future = pool.submit(run_replication, alg_cls, quantum, overheat, disk_cost, spec, next_seed)
+                in_flight[future] = next_seed
+                next_seed += 1
+
+            if not in_flight:
+                break
+
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                done[in_flight.pop(future)] = future.result()
+
+            # consume results in seed order so the stopping point doesn't depend on scheduling
+            while base_seed + len(results) in done:
+                results.append(done.pop(base_seed + len(results)))
+                if targets and len(results) >= min_replications and targets_met(summarize(results, confidence), targets):
+                    stopped_early = len(results) < max_replications
+                    break
+            else:
+                continue
+
+            for future in in_flight:
+                future.cancel()
+            break
+
+    return {
+        "algorithm": alg_cls.__name__,
+        "replications": len(results),
+        "confidence": confidence,
+        "stopped_early": stopped_early,
+        "targets": targets,
+        "metrics": summarize(results, confidence),
+    }
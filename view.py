@@ -1,138 +1,8 @@
 import csv
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import json
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.patches as patches
-from matplotlib.lines import Line2D
-
-from model import Fifo, Sjf, Round_Robin, EDF, CFS_Sim, Process
-
-def load_processes(path):
-    with open(path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
-
-    processes = []
-    for p in raw:
-        proc = Process(
-            p["id"],
-            p["arrival"],
-            p["total_time"],
-            p["priority"],
-            p.get("deadline", None),
-            p.get("num_pages", 1)
-        )
-        processes.append(proc)
-
-    return processes
-
-def select_color(state_type: str) -> str:
-    if state_type == "executing":
-        return "green"
-    if state_type == "waiting":
-        return "blue"
-    if state_type == "overhead":
-        return "red"
-    return "gray"
-
-def build_gantt(alg,gray_after_deadline: bool = False):
-    fig = plt.Figure(figsize=(10, 5), dpi=100)
-    ax = fig.add_subplot(111)
-
-    y_pos = {}
-    y = 0
-    for p in alg.finished_process:
-        y_pos[p.id] = y
-        y += 1
-
-    max_time = 0
-    for p in alg.finished_process:
-        current_time = p.arrival
-
-        for state in p.time_line:
-            duration = state.duration
-            stype = state.type
-
-            start = current_time
-            width = float(duration)
-            end = start + width
-
-            color = select_color(stype)
-            if(gray_after_deadline and p.absolute_deadline!=None and p.absolute_deadline < end ):
-                width = p.absolute_deadline - start
-                if(width>0):
-                    ax.add_patch(patches.Rectangle(
-                        (start, y_pos[p.id]), width, 0.8,
-                        facecolor=color, edgecolor="black", alpha=0.9
-                    ))
-                    start += width
-                if(width<0):
-                    width=0
-                color = select_color("deadline")
-                width = float(duration) - width
-
-
-            ax.add_patch(patches.Rectangle(
-                (start, y_pos[p.id]), width, 0.8,
-                facecolor=color, edgecolor="black", alpha=0.9
-            ))
 
-            current_time = end
-            if end > max_time:
-                max_time = end
-
-        if p.absolute_deadline is not None:
-            try:
-                dline = p.absolute_deadline
-
-                ax.axvline(
-                    dline,
-                    color="brown",
-                    linestyle="--",
-                    linewidth=0.8,
-                    alpha=0.6
-                )
-
-                ax.text(
-                    dline + 0.1,
-                    y_pos[p.id] + 0.4,
-                    f"{p.id}",
-                    color="black",
-                    fontsize=8,
-                    rotation=90,
-                    va="center"
-                )
-
-            except Exception:
-                pass
-
-    ticks = [y_pos[k] + 0.4 for k in y_pos.keys()]
-    labels = [str(k) for k in y_pos.keys()]
-    ax.set_yticks(ticks)
-    ax.set_yticklabels(labels)
-
-    ax.set_xlim(0, max_time + 1)
-    ax.set_xticks(range(0, int(max_time) + 1, 2))
-    ax.set_ylim(-0.1, max(0, len(y_pos)) )
-    ax.set_xlabel("Tempo")
-    ax.set_title("Gráfico de Gantt")
-
-    ax.invert_yaxis()
-
-    fig.tight_layout()
-
-    legend_elements = [
-    Line2D([0], [0], color="green", lw=6, label="Executando"),
-    Line2D([0], [0], color="blue", lw=6, label="Esperando"),
-    Line2D([0], [0], color="red", lw=6, label="Overhead"),
-    Line2D([0], [0], color="grey", lw=6, label="Estouro de deadline"),
-    Line2D([0], [0], color="brown", lw=2, linestyle="--", label="Deadline Absoluto"),
-]
-
-    ax.legend(handles=legend_elements, loc="upper right")
-
-    return fig
+from model import ALGORITHMS, load_processes
 
 class SimulatorGUI(tk.Tk):
     def __init__(self):
@@ -152,7 +22,7 @@ class SimulatorGUI(tk.Tk):
         ttk.Label(top, text="Algoritmo:").pack(side="left", padx=10)
         self.alg_var = tk.StringVar(value="FIFO")
         ttk.Combobox(top, textvariable=self.alg_var,
-                     values=["FIFO", "SJF", "Round Robin", "EDF", "CFS"],
+                     values=list(ALGORITHMS),
                      width=20).pack(side="left")
 
         params = ttk.Frame(self)
@@ -213,22 +83,18 @@ class SimulatorGUI(tk.Tk):
 
         alg = self.alg_var.get()
 
-        if alg == "FIFO":
-            executor = Fifo(quantum, overheat, disk_cost, procs)
-        elif alg == "SJF":
-            executor = Sjf(quantum, overheat, disk_cost, procs)
-        elif alg == "Round Robin":
-            executor = Round_Robin(quantum, overheat, disk_cost, procs)
-        elif alg == "EDF":
-            executor = EDF(quantum, overheat, disk_cost, procs)
-        elif alg == "CFS":
-            executor = CFS_Sim(quantum, overheat, disk_cost, procs)
-        else:
+        if alg not in ALGORITHMS:
             messagebox.showerror("Erro", f"Algoritmo desconhecido: {alg}")
             return
 
+        executor = ALGORITHMS[alg](quantum, overheat, disk_cost, procs)
+
         executor.execute()
 
+        # plotting is loaded on the first run, so the window opens without it
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from gantt import build_gantt
+
         fig = build_gantt(executor,gray_after_deadline=self.gray_deadline_var.get())
 
         if self.canvas_widget:
@@ -0,0 +1,88 @@
+import contextlib
+import json
+import sys
+
+from model import ALGORITHMS, load_processes, process_from_dict
+
+# one JSON request per line in, one JSON response per line out:
+#   {"id": 1, "algorithm": "EDF", "file": "processes.json", "quantum": 2, "chart": "out.png"}
+#   {"id": 1, "ok": true, "total_time": 39, "metrics": {...}, "chart": "out.png"}
+
+def preload():
+    # pay for numpy and matplotlib once, before the first request instead of during it
+    import matplotlib.backends.backend_agg
+    import gantt
+    import replication
+
+def simulate(request: dict) -> dict:
+    from replication import run_metrics
+
+    name = request.get("algorithm", "FIFO")
+    if name not in ALGORITHMS:
+        raise ValueError(f"Algoritmo desconhecido: {name}")
+
+    quantum = request.get("quantum", 2)
+    overheat = request.get("overheat", 1)
+    for value in (quantum, overheat):
+        # same limits as the GUI; a zero quantum would block the worker forever
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            raise ValueError("Quantum e Overheat devem ser inteiros, no mínimo 1.")
+
+    if "processes" in request:
+        procs = [process_from_dict(p) for p in request["processes"]]
+    else:
+        procs = load_processes(request["file"])
+
+    executor = ALGORITHMS[name](
+        quantum,
+        overheat,
+        request.get("disk_cost", 0),
+        procs
+    )
+    # stdout carries the protocol; the algorithms' own prints go to stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        executor.execute()
+
+    response = {
+        "total_time": executor.actual_time,
+        "metrics": run_metrics(executor),
+    }
+
+    chart = request.get("chart")
+    if chart:
+        from gantt import save_gantt, save_gantt_html
+
+        gray = request.get("gray_after_deadline", False)
+        if chart.lower().endswith(".html"):
+            save_gantt_html(executor, chart, gray_after_deadline=gray)
+        else:
+            save_gantt(executor, chart, gray_after_deadline=gray)
+        response["chart"] = chart
+
+    return response
+
+def handle(line: str) -> dict:
+    try:
+        request = json.loads(line)
+    except ValueError as e:
+        return {"ok": False, "error": f"JSON inválido: {e}"}
+    if not isinstance(request, dict):
+        return {"ok": False, "error": "A requisição deve ser um objeto JSON."}
+
+    response = {"id": request.get("id"), "ok": True}
+    try:
+        response.update(simulate(request))
+    except Exception as e:
+        response["ok"] = False
+        response["error"] = f"{type(e).__name__}: {e}"
+    return response
+
+def serve(infile=sys.stdin, outfile=sys.stdout, warm: bool = True):
+    if warm:
+        preload()
+
+    for line in infile:
+        if not line.strip():
+            continue
+        outfile.write(json.dumps(handle(line)) + "\n")
+        outfile.flush()